@@ -1,14 +1,11 @@
 import streamlit as st
 import pandas as pd
 import time
-import requests
-import json
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 import streamlit.components.v1 as components
 import data_manager as dm
 import ai_utils
+import profiler
 import io
 
 # --- CONFIGURATION ---
@@ -40,6 +37,11 @@ if 'tech_elapsed' not in st.session_state:
     st.session_state.tech_elapsed = 0
 if 'api_key' not in st.session_state:
     st.session_state.api_key = ""
+if 'profiling' not in st.session_state:
+    st.session_state.profiling = profiler.ENABLED
+
+# Collect timings for this rerun only (per session, never shared)
+profiler.start_run(st.session_state.profiling)
 
 # --- HELPER FUNCTIONS ---
 def get_quote(api_key=None):
@@ -117,7 +119,7 @@ st.title("🚀 Growth Engine")
 
 tabs = st.tabs(["📊 Dashboard", "🏋️ Gym Tracker", "📈 Analysis", "👨‍🍳 Recipes", "🛒 Grocery", "⚙️ Settings"])
 
-with tabs[0]: # DASHBOARD
+with tabs[0], profiler.section("tab:dashboard"): # DASHBOARD
     # --- QUOTE ---
     quote = get_quote(st.session_state.api_key)
     st.markdown(f"""
@@ -220,7 +222,7 @@ with tabs[0]: # DASHBOARD
                 dm.save_audit_data(entry)
                 st.success("✅ Progress Saved!")
 
-with tabs[1]: # GYM TRACKER (New)
+with tabs[1], profiler.section("tab:gym"): # GYM TRACKER (New)
     st.header("🏋️ Gym Workout Tracker")
     
     st.markdown("### 🎙️ AI Quick Log")
@@ -296,14 +298,27 @@ with tabs[1]: # GYM TRACKER (New)
             st.success("Workout Logged!")
 
 
-with tabs[2]: # ANALYSIS
+with tabs[2], profiler.section("tab:analysis"): # ANALYSIS
     st.header("📈 Deep Dive Analysis")
+    # Streamlit runs every tab's code on every rerun, so plotly (and the chart
+    # prep) only load once the user asks for charts
+    show_charts = st.toggle("📊 Show Charts", key="analysis_show_charts")
+    if show_charts:
+        with profiler.section("import:plotly", "import"):
+            import plotly.express as px
+
+    # Protein and gym logs are partitioned by month, so a shorter range reads fewer files
+    history_ranges = {"Last 3 Months": 90, "Last 12 Months": 365, "All Time": None}
+    history_range = st.selectbox("History Range", list(history_ranges.keys()), index=1)
+    range_days = history_ranges[history_range]
+    range_start = date.today() - timedelta(days=range_days) if range_days else None
     
     # Audit History
     st.subheader("🗓️ Task History")
     audit_df = dm.load_audit_data()
     if not audit_df.empty:
         st.dataframe(audit_df.sort_values("Date", ascending=False), use_container_width=True)
+    if not audit_df.empty and show_charts:
         # Charts... (Existing)
         col_charts_1, col_charts_2 = st.columns(2)
         with col_charts_1:
@@ -311,66 +326,91 @@ with tabs[2]: # ANALYSIS
             st.write("### 📚 Study Hours")
             audit_df['Date'] = pd.to_datetime(audit_df['Date'])
             audit_df = audit_df.sort_values('Date')
-            study_df = audit_df[['Date', 'CPA_Hours', 'Tech_AI_Hours']].melt('Date', var_name='Type', value_name='Hours')
-            fig_bar = px.bar(study_df, x='Date', y='Hours', color='Type', title="Daily Study Hours", barmode='stack')
+            study_df = dm.study_hours_long(audit_df)
+            with profiler.section("chart:study_hours", "plotly"):
+                fig_bar = px.bar(study_df, x='Date', y='Hours', color='Type', title="Daily Study Hours", barmode='stack')
             st.plotly_chart(fig_bar, use_container_width=True)
             
         with col_charts_2:
             # 2. Habit Heatmap
             st.write("### 🔥 Habit Consistency")
-            habit_cols = ['Gym', 'Cardio', 'Diet_Adherence', 'Dog_Walks', 'Dog_Grooming', 'Supp_Omega3']
-            heatmap_data = []
-            for idx, row in audit_df.iterrows():
-                d_str = row['Date'].strftime('%Y-%m-%d')
-                for habit in habit_cols:
-                    val = 1 if row[habit] else 0
-                    if habit == 'Dog_Walks' and row[habit] > 0: val = 1
-                    heatmap_data.append({'Date': d_str, 'Habit': habit, 'Done': val})
+            hm_df = dm.habit_heatmap_data(audit_df)
             
-            if heatmap_data:
-                hm_df = pd.DataFrame(heatmap_data)
-                fig_hm = px.density_heatmap(hm_df, x='Date', y='Habit', z='Done', color_continuous_scale='Greens', title="Habit Heatmap")
+            if not hm_df.empty:
+                with profiler.section("chart:habit_heatmap", "plotly"):
+                    fig_hm = px.density_heatmap(hm_df, x='Date', y='Habit', z='Done', color_continuous_scale='Greens', title="Habit Heatmap")
                 st.plotly_chart(fig_hm, use_container_width=True)
-    else:
+    elif audit_df.empty:
         st.info("No audit data yet.")
         
     st.divider()
     
     # Protein History
     st.subheader("🍗 Protein Intake")
-    p_df = dm.load_protein_log()
-    if not p_df.empty:
-        p_df['Date'] = pd.to_datetime(p_df['Date'])
-        daily_p = p_df.groupby('Date')['Protein_g'].sum().reset_index()
-        fig_p = px.line(daily_p, x='Date', y='Protein_g', markers=True, title="Daily Protein Intake (g)")
-        fig_p.add_hline(y=150, line_dash="dash", line_color="green", annotation_text="Target (150g)")
+    p_df = dm.load_protein_log(start_date=range_start)
+    if not p_df.empty and show_charts:
+        daily_p = dm.daily_protein_totals(p_df)
+        with profiler.section("chart:daily_protein", "plotly"):
+            fig_p = px.line(daily_p, x='Date', y='Protein_g', markers=True, title="Daily Protein Intake (g)")
+            fig_p.add_hline(y=150, line_dash="dash", line_color="green", annotation_text="Target (150g)")
         st.plotly_chart(fig_p, use_container_width=True)
+    elif not p_df.empty:
+        st.caption(f"{len(p_df)} entries, {p_df['Protein_g'].sum():g}g total. Turn on Show Charts for the daily trend.")
     else:
-        st.info("No protein logs yet.")
+        st.info("No protein logs in this range.")
         
     st.divider()
     
     # Gym Analytics
     st.subheader("🏋️ Gym History")
-    gym_df = dm.load_workout_log()
+    gym_df = dm.load_workout_log(start_date=range_start)
     if not gym_df.empty:
         st.dataframe(gym_df, use_container_width=True)
         
-        # Download Button (Excel)
-        buffer = io.BytesIO()
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-            gym_df.to_excel(writer, index=False, sheet_name='Workouts')
-            
-        st.download_button(
-            label="📥 Download History (Excel)",
-            data=buffer.getvalue(),
-            file_name="gym_history.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
+        # Download Button (Excel) - only built on request, openpyxl is slow to load
+        if st.button("📦 Prepare Excel Export"):
+            with profiler.section("export:excel", "export"):
+                buffer = io.BytesIO()
+                with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+                    gym_df.to_excel(writer, index=False, sheet_name='Workouts')
+
+            st.download_button(
+                label="📥 Download History (Excel)",
+                data=buffer.getvalue(),
+                file_name="gym_history.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
     else:
-        st.info("No workout logs yet.")
+        st.info("No workout logs in this range.")
+
+    # Progression (served from the precomputed stats index, so not limited by History Range)
+    st.write("### 📈 Exercise Progression (All Time)")
+    gym_stats = dm.load_workout_stats()
+    exercise_keys = sorted(gym_stats['exercises'].keys())
+    if exercise_keys:
+        ex_key = st.selectbox("Exercise", exercise_keys, format_func=lambda k: gym_stats['exercises'][k]['Exercise'])
+        ex_stats = gym_stats['exercises'][ex_key]
+        last = ex_stats['last_entry']
 
-with tabs[3]: # RECIPES
+        e1, e2, e3 = st.columns(3)
+        with e1: st.metric("Weight PR", f"{ex_stats['pr_weight']:g} kg", help=f"Set on {ex_stats['pr_weight_date']}")
+        with e2: st.metric("Best Est. 1RM", f"{ex_stats['pr_e1rm']:g} kg", help=f"Set on {ex_stats['pr_e1rm_date']}")
+        with e3: st.metric("Sessions", ex_stats['sessions'])
+        st.caption(f"Last time ({ex_stats['last_date']}): {last['Target_Sets_Reps'] or '-'} @ {last['Max_Weight']:g} kg, reps {last['Reps'] or '-'}, volume {last['volume']:g} kg")
+
+        if show_charts:
+            weekly_df = pd.DataFrame(sorted(ex_stats['weekly_volume'].items()), columns=['Week', 'Volume'])
+            with profiler.section("chart:weekly_volume", "plotly"):
+                fig_vol = px.bar(weekly_df, x='Week', y='Volume', title=f"Weekly Volume - {ex_stats['Exercise']}, All Time (kg)")
+            st.plotly_chart(fig_vol, use_container_width=True)
+
+    if gym_stats['muscles'] and show_charts:
+        muscle_df = dm.muscle_weekly_volume(gym_stats)
+        with profiler.section("chart:muscle_volume", "plotly"):
+            fig_mv = px.bar(muscle_df, x='Week', y='Volume', color='Muscle', title="Weekly Volume per Muscle - All Time (kg)", barmode='stack')
+        st.plotly_chart(fig_mv, use_container_width=True)
+
+with tabs[3], profiler.section("tab:recipes"): # RECIPES
     st.header("👨‍🍳 Healthy Kitchen Vault")
     subtabs = st.tabs(["Add New Recipe", "Browse Vault"])
     # ... (Existing Recipe Code) ...
@@ -400,7 +440,7 @@ with tabs[3]: # RECIPES
         else:
             st.info("No recipes found. Add one!")
 
-with tabs[4]: # GROCERY
+with tabs[4], profiler.section("tab:grocery"): # GROCERY
     st.header("🛒 Smart Grocery List")
     recipes_df = dm.load_recipe_data()
     # ... (Existing Grocery Code) ...
@@ -424,7 +464,7 @@ with tabs[4]: # GROCERY
     else:
         st.warning("Add recipes to the vault first!")
 
-with tabs[5]: # SETTINGS
+with tabs[5], profiler.section("tab:settings"): # SETTINGS
     st.header("⚙️ Settings")
     st.write("Configure external integrations.")
     
@@ -433,6 +473,46 @@ with tabs[5]: # SETTINGS
     if key:
         st.session_state.api_key = key
         st.success("API Key saved!")
-    
+
+    st.divider()
+
+    # --- DEBUG PANEL ---
+    st.subheader("🛠️ Performance Debug")
+    profiling = st.toggle("Profile each rerun", value=st.session_state.profiling)
+    if profiling != st.session_state.profiling:
+        st.session_state.profiling = profiling
+        st.rerun()
+
+    if profiling:
+        timers = profiler.summary()
+        if timers:
+            st.caption("Timings for the rerun that rendered this page.")
+            st.dataframe(pd.DataFrame(timers), use_container_width=True, hide_index=True)
+            counter_values = profiler.counters()
+            if counter_values:
+                st.json(counter_values)
+
+            d1, d2 = st.columns(2)
+            with d1:
+                st.download_button("📥 Export JSON", data=profiler.to_json(), file_name="growth_profile.json", mime="application/json")
+            with d2:
+                st.download_button("📥 Export Chrome Trace", data=profiler.to_chrome_trace(), file_name="growth_trace.json", mime="application/json")
+        else:
+            st.info("No timings yet - interact with the app to trigger a rerun.")
+
+    st.divider()
+
+    # --- STORAGE ---
+    st.subheader("🗄️ Storage")
+    st.caption("Protein and gym logs are stored per month. Compaction merges each finished year into one compressed archive.")
+    if st.button("🗜️ Compact Old Logs"):
+        with st.spinner("Compacting..."):
+            archived = dm.compact_logs()
+        done = {log: years for log, years in archived.items() if years}
+        if done:
+            st.success("Archived " + ", ".join(f"{log}: {', '.join(map(str, years))}" for log, years in done.items()))
+        else:
+            st.info("Nothing to compact.")
+
     st.divider()
     st.sidebar.info("Navigation moved to top tabs.")
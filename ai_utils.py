@@ -1,8 +1,14 @@
-import google.generativeai as genai
 import json
-import streamlit as st
-import io
+import profiler
 
+# google.generativeai pulls in grpc/protobuf and takes seconds to import,
+# so it is only loaded the first time an AI feature is actually used.
+@profiler.instrument("ai_utils.import_genai", category="import")
+def _genai():
+    import google.generativeai as genai
+    return genai
+
+@profiler.instrument(category="ai")
 def transcribe_audio(audio_file, api_key):
     """
     Transcribes audio file object using Google Gemini 2.5 Pro.
@@ -12,6 +18,7 @@ def transcribe_audio(audio_file, api_key):
         return None, "API Key missing."
         
     try:
+        genai = _genai()
         genai.configure(api_key=api_key)
         
         # Read the audio bytes
@@ -38,6 +45,7 @@ def transcribe_audio(audio_file, api_key):
         # We will report the error.
         return None, str(e)
 
+@profiler.instrument(category="ai")
 def parse_workout_text(text, api_key):
     """
     Uses Google Gemini 2.5 Pro to parse natural language workout text into a JSON object.
@@ -47,6 +55,7 @@ def parse_workout_text(text, api_key):
         return None, "API Key missing."
         
     try:
+        genai = _genai()
         genai.configure(api_key=api_key)
         model = genai.GenerativeModel("gemini-2.5-pro")
         
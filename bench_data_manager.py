@@ -0,0 +1,230 @@
+"""
+Benchmarks for data_manager entry points and the Analysis tab's chart prep.
+
+For each scale, writes a synthetic dataset (see synthetic_data.py) to a temp
+directory, points data_manager at it and times every case. The data ends on
+synthetic_data.END_DATE, which also stands in for "today", so results don't
+drift from day to day. Reports median
+latency and peak Python memory (tracemalloc), and compares against stored
+baselines to flag regressions.
+
+Usage:
+    python bench_data_manager.py --rows 1000 10000 100000
+    python bench_data_manager.py --rows 1000 10000 --save-baseline
+Exits with status 1 if any case regresses past the tolerance.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+import pandas as pd
+import data_manager as dm
+import synthetic_data
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baselines.json")
+
+DEFAULT_ROWS = [1_000, 10_000]
+DEFAULT_REPEAT = 5
+
+# A case regresses when it is this much slower / hungrier than its baseline
+DEFAULT_TOLERANCE = 0.25
+
+DATA_FILE_ATTRS = {
+    "audit": "AUDIT_FILE",
+    "protein": "PROTEIN_FILE",
+    "workout": "WORKOUT_FILE",
+    "recipes": "RECIPE_FILE"
+}
+LOG_ATTRS = ["PROTEIN_DIR", "WORKOUT_DIR", "WORKOUT_STATS_FILE"]
+
+def build_cases(today):
+    """
+    (name, callable) pairs. Reads happen inside each call so file I/O is timed;
+    save_* cases append a row per call, which is negligible at these sizes.
+    """
+    recent = str(date.fromisoformat(today) - timedelta(days=90))
+    audit_entry = {col: 0 for col in dm.REQUIRED_COLUMNS}
+    audit_entry["Date"] = today
+    protein_entry = {"Date": today, "Food_Name": "Eggs", "Quantity": 3, "Unit": "pcs", "Protein_g": 18.0}
+    workout_entry = {
+        "Date": today, "Exercise": "Bench Press", "Target_Muscle": "Chest", "Region": "Upper Body",
+        "Target_Sets_Reps": "3x8", "Min_Weight": 50.0, "Max_Weight": 70.0, "Reps": "8", "Notes": ""
+    }
+    recipe_entry = {"Name": "Bench Recipe", "Tags": "Quick", "Ingredients": "2 eggs", "Instructions": "Cook."}
+
+    def ingredient_lines():
+        recipes = dm.load_recipe_data()
+        return [line for items in recipes['Ingredients'] for line in str(items).split('\n') if line.strip()]
+
+    def audit_sorted():
+        audit_df = dm.load_audit_data()
+        audit_df['Date'] = pd.to_datetime(audit_df['Date'])
+        return audit_df.sort_values('Date')
+
+    return [
+        ("load_audit_data", dm.load_audit_data),
+        ("save_audit_data", lambda: dm.save_audit_data(audit_entry)),
+        ("calculate_streaks", lambda: dm.calculate_streaks(dm.load_audit_data(), today)),
+        ("load_protein_log", dm.load_protein_log),
+        ("load_protein_log:90_days", lambda: dm.load_protein_log(start_date=recent)),
+        ("save_protein_entry", lambda: dm.save_protein_entry(protein_entry)),
+        ("get_daily_protein_total", lambda: dm.get_daily_protein_total(today)),
+        ("load_workout_log", dm.load_workout_log),
+        ("save_workout_entry", lambda: dm.save_workout_entry(workout_entry)),
+        ("rebuild_workout_stats", dm.rebuild_workout_stats),
+        ("load_workout_stats", dm.load_workout_stats),
+        ("load_recipe_data", dm.load_recipe_data),
+        ("save_recipe_data", lambda: dm.save_recipe_data(recipe_entry)),
+        ("aggregate_ingredients", lambda: dm.aggregate_ingredients(ingredient_lines())),
+        ("chart:study_hours", lambda: dm.study_hours_long(audit_sorted())),
+        ("chart:habit_heatmap", lambda: dm.habit_heatmap_data(audit_sorted())),
+        ("chart:daily_protein", lambda: dm.daily_protein_totals(dm.load_protein_log())),
+        ("chart:muscle_volume", lambda: dm.muscle_weekly_volume(dm.load_workout_stats()))
+    ]
+
+# Re-run after compact_logs() to see reads against the archived layout
+POST_COMPACTION_CASES = ["load_protein_log", "load_protein_log:90_days", "get_daily_protein_total", "load_workout_log"]
+
+def time_case(fn, repeat):
+    """
+    Median wall time (ms) over `repeat` calls, then one extra call under
+    tracemalloc for peak memory (MB) so tracing doesn't skew the timings.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"median_ms": round(statistics.median(timings), 3), "peak_mb": round(peak / 2**20, 3)}
+
+def time_once(fn, data_dir):
+    """
+    Wall time of a single untraced call, for one-shot jobs whose later calls
+    are no-ops. Peak memory comes from a second call under tracemalloc
+    against a copy of data_dir taken beforehand, so it has the same work to do.
+    """
+    attrs = list(DATA_FILE_ATTRS.values()) + LOG_ATTRS
+    with tempfile.TemporaryDirectory() as tmp:
+        copy_dir = os.path.join(tmp, "data")
+        shutil.copytree(data_dir, copy_dir)
+
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+
+        saved = {attr: getattr(dm, attr) for attr in attrs}
+        try:
+            for attr in attrs:
+                setattr(dm, attr, os.path.join(copy_dir, os.path.relpath(saved[attr], data_dir)))
+            tracemalloc.start()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            for attr, value in saved.items():
+                setattr(dm, attr, value)
+    return {"median_ms": round(elapsed * 1000, 3), "peak_mb": round(peak / 2**20, 3)}
+
+def run_scale(rows, repeat, seed, only=None):
+    today = synthetic_data.END_DATE
+    saved = {attr: getattr(dm, attr) for attr in list(DATA_FILE_ATTRS.values()) + LOG_ATTRS}
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = synthetic_data.write_dataset(tmp, rows, seed, end=today)
+        try:
+            for name, attr in DATA_FILE_ATTRS.items():
+                setattr(dm, attr, paths[name])
+            for attr in LOG_ATTRS:
+                setattr(dm, attr, os.path.join(tmp, os.path.basename(saved[attr])))
+
+            # Split the generated single-file logs into partitions and build
+            # the stats index up front, so one-off migration isn't timed
+            dm.load_protein_log()
+            dm.load_workout_stats()
+
+            cases = build_cases(today)
+            for name, fn in cases:
+                if only and name not in only:
+                    continue
+                results[name] = time_case(fn, repeat)
+
+            if not only or "compact_logs" in only:
+                # Everything before END_DATE's year is cold
+                archive_before_year = date.fromisoformat(today).year
+                results["compact_logs"] = time_once(lambda: dm.compact_logs(archive_before_year), tmp)
+                for name, fn in cases:
+                    if name in POST_COMPACTION_CASES and (not only or name in only):
+                        results[f"{name}:compacted"] = time_case(fn, repeat)
+        finally:
+            for attr, value in saved.items():
+                setattr(dm, attr, value)
+    return results
+
+def load_baselines(path):
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_baselines(path, baselines):
+    with open(path, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+
+def compare(result, baseline, tolerance):
+    """
+    Returns a list of regression messages for one case (empty if fine).
+    """
+    problems = []
+    for metric in ("median_ms", "peak_mb"):
+        base = baseline.get(metric)
+        if base and result[metric] > base * (1 + tolerance):
+            problems.append(f"{metric} {result[metric]:g} vs baseline {base:g} (+{result[metric] / base - 1:.0%})")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark data_manager hot paths.")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="dataset sizes to run")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--case", action="append", help="only run the named case (repeatable)")
+    parser.add_argument("--baseline-file", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    baselines = load_baselines(args.baseline_file)
+    regressions = []
+
+    for rows in args.rows:
+        print(f"\n== {rows:,} rows ==")
+        print(f"{'case':<36}{'median ms':>12}{'peak MB':>10}  status")
+        for name, result in run_scale(rows, args.repeat, args.seed, args.case).items():
+            key = f"{name}@{rows}"
+            problems = compare(result, baselines.get(key, {}), args.tolerance)
+            status = "REGRESSION" if problems else ("ok" if key in baselines else "new")
+            print(f"{name:<36}{result['median_ms']:>12.2f}{result['peak_mb']:>10.2f}  {status}")
+            regressions.extend(f"{key}: {p}" for p in problems)
+            if args.save_baseline:
+                baselines[key] = result
+
+    if args.save_baseline:
+        save_baselines(args.baseline_file, baselines)
+        print(f"\nBaselines saved to {args.baseline_file}")
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions and not args.save_baseline else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
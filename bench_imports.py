@@ -0,0 +1,135 @@
+"""
+Import-time benchmark for the app's modules.
+
+Runs `python -X importtime` in a fresh interpreter and checks that
+- heavy optional dependencies (plotly, google-generativeai, openpyxl) are not
+  pulled in just by importing data_manager / ai_utils
+- the median cold import time over a few fresh interpreters stays under a
+  budget (a single cold run swings by 100+ ms with disk cache and CPU load)
+
+Personal_Growth_App.py can't be imported outside `streamlit run`, so it is
+checked statically instead: the deferred modules must not be imported by
+code that runs on every rerun (module level, including `with` blocks such
+as tab bodies); they belong inside an `if`, a function, etc.
+
+Usage: python bench_imports.py [--budget-ms 1000] [--runs 5] [--top 10]
+Exits with status 1 if any check fails, so it can gate CI.
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = ["data_manager", "ai_utils"]
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Personal_Growth_App.py")
+
+# Loaded lazily by the features that need them
+DEFERRED_MODULES = ["plotly", "google.generativeai", "openpyxl"]
+
+# Single cold runs measured at ~415-630 ms (pandas dominates); the budget
+# applies to the median and leaves room for slower machines
+IMPORT_BUDGET_MS = 1000
+DEFAULT_RUNS = 5
+
+def measure_imports(modules):
+    """
+    Imports the given modules in a fresh interpreter with -X importtime.
+    Returns a list of (module, self_us, cumulative_us, depth), leaving out
+    whatever the bare interpreter already imports at startup.
+    """
+    startup = {name for name, _, _, _ in _run_importtime("pass")}
+    rows = _run_importtime("import " + ", ".join(modules))
+    return [r for r in rows if r[0] not in startup]
+
+def _run_importtime(code):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2][1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(parts[0]), int(parts[1]), depth))
+    return rows
+
+def _is_deferred(module):
+    return any(module == mod or module.startswith(mod + ".") for mod in DEFERRED_MODULES)
+
+def _unconditional_statements(body):
+    # Statements that run every time their block runs; `with` and `try`
+    # bodies always run, anything under if/for/while/def/class may not
+    for node in body:
+        yield node
+        if isinstance(node, (ast.With, ast.AsyncWith)):
+            yield from _unconditional_statements(node.body)
+        elif isinstance(node, ast.Try):
+            yield from _unconditional_statements(node.body)
+            yield from _unconditional_statements(node.finalbody)
+
+def eager_app_imports(path=APP_FILE):
+    """
+    (line, module) for each deferred module the app imports on every rerun.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    found = []
+    for node in _unconditional_statements(tree.body):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module]
+        else:
+            continue
+        found.extend((node.lineno, name) for name in names if _is_deferred(name))
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description="Check cold import time of the app modules.")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="fresh interpreters to take the median over")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = []
+    for _ in range(max(args.runs, 1)):
+        rows = measure_imports(MODULES)
+        runs.append((sum(cum for _, _, cum, depth in rows if depth == 0) / 1000, rows))
+    runs.sort(key=lambda run: run[0])
+    total_ms, rows = runs[len(runs) // 2]
+    imported = {name for _, run_rows in runs for name, _, _, _ in run_rows}
+
+    print(f"Cold import of {', '.join(MODULES)}: median {total_ms:.1f} ms over {len(runs)} runs "
+          f"(min {runs[0][0]:.1f}, max {runs[-1][0]:.1f}; budget {args.budget_ms:g} ms)")
+    print("Slowest top-level imports:")
+    top_level = sorted((r for r in rows if r[3] == 0), key=lambda r: r[2], reverse=True)
+    for name, _, cum, _ in top_level[:args.top]:
+        print(f"  {cum / 1000:8.1f} ms  {name}")
+
+    failures = []
+    for mod in DEFERRED_MODULES:
+        if mod in imported:
+            failures.append(f"{mod} is imported eagerly; it should only load when its feature runs")
+    for line, mod in eager_app_imports():
+        failures.append(f"{os.path.basename(APP_FILE)}:{line} imports {mod} on every rerun; import it where the feature runs")
+    if total_ms > args.budget_ms:
+        failures.append(f"median import time {total_ms:.1f} ms exceeds budget of {args.budget_ms:g} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Fault-injection checks for the partitioned log storage in data_manager.
+
+Runs the legacy-log migration and compact_logs() against small temp
+datasets, failing the Nth file operation (rename, delete, copy, CSV write)
+for every N the job performs. After each failure it checks that
+- reading the log returns exactly the original rows (nothing lost or doubled)
+- re-running the job finishes it and leaves no staging or temp files behind
+  (and, for compaction, no monthly files for the archived years)
+
+Usage: python check_storage_recovery.py
+Exits with status 1 if any check fails.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import pandas as pd
+import data_manager as dm
+
+PATH_ATTRS = ["AUDIT_FILE", "RECIPE_FILE", "PROTEIN_FILE", "WORKOUT_FILE", "PROTEIN_DIR", "WORKOUT_DIR", "WORKOUT_STATS_FILE"]
+
+# Left behind only by an unfinished migration or compaction
+LEFTOVER_SUFFIXES = (".tmp", ".old", ".migrating", ".compacting")
+
+class InjectedFault(OSError):
+    pass
+
+class FaultInjector:
+    """
+    Patches the file operations data_manager uses so the Nth call fails.
+    With fail_at=None nothing fails; `calls` counts the operations.
+    """
+    TARGETS = [
+        (os, "replace"), (os, "remove"), (os, "rmdir"),
+        (shutil, "rmtree"), (shutil, "copy2"), (pd.DataFrame, "to_csv")
+    ]
+
+    def __init__(self, fail_at=None):
+        self.fail_at = fail_at
+        self.calls = 0
+        self.saved = []
+
+    def __enter__(self):
+        for owner, attr in self.TARGETS:
+            original = getattr(owner, attr)
+            self.saved.append((owner, attr, original))
+            setattr(owner, attr, self._wrap(f"{getattr(owner, '__name__', owner)}.{attr}", original))
+        return self
+
+    def __exit__(self, *exc):
+        for owner, attr, original in self.saved:
+            setattr(owner, attr, original)
+        return False
+
+    def _wrap(self, label, original):
+        def wrapper(*args, **kwargs):
+            self.calls += 1
+            if self.calls == self.fail_at:
+                raise InjectedFault(f"injected failure in {label}")
+            return original(*args, **kwargs)
+        return wrapper
+
+def _rows(month, count, start=0):
+    return pd.DataFrame({
+        "Date": [f"{month}-{day % 28 + 1:02d}" for day in range(start, start + count)],
+        "Food_Name": [f"Food {start + i}" for i in range(count)],
+        "Quantity": [i + 1 for i in range(count)],
+        "Unit": ["g"] * count,
+        "Protein_g": [float(i) + 0.5 for i in range(count)]
+    })
+
+def _write_month(log_dir, month, df):
+    os.makedirs(log_dir, exist_ok=True)
+    df.to_csv(os.path.join(log_dir, f"{month}.csv"), index=False)
+
+def fixture_migration(tmp):
+    _rows("2024-11", 3).to_csv(dm.PROTEIN_FILE, index=False)
+    pd.concat([_rows("2024-12", 3), _rows("2025-01", 2)]).to_csv(dm.PROTEIN_FILE, mode="a", header=False, index=False)
+
+def fixture_migration_onto_partitions(tmp):
+    fixture_migration(tmp)
+    _write_month(dm.PROTEIN_DIR, "2025-01", _rows("2025-01", 2, start=10))
+    _write_month(dm.PROTEIN_DIR, "2025-02", _rows("2025-02", 2))
+
+def fixture_compaction(tmp):
+    for month in ["2023-03", "2023-07", "2024-01", "2024-12", "2025-02"]:
+        _write_month(dm.PROTEIN_DIR, month, _rows(month, 3))
+    # An earlier compaction of 2023, before more 2023 rows were backfilled
+    _rows("2023-01", 2, start=20).to_csv(os.path.join(dm.PROTEIN_DIR, "2023.csv.gz"), index=False, compression="gzip")
+
+def fixture_migration_and_compaction(tmp):
+    fixture_compaction(tmp)
+    fixture_migration(tmp)
+
+SCENARIOS = [
+    # (name, fixture, archive_before_year); None means the job is a plain read,
+    # which runs the migration
+    ("migration", fixture_migration, None),
+    ("migration onto partitions", fixture_migration_onto_partitions, None),
+    ("compaction", fixture_compaction, 2025),
+    ("migration + compaction", fixture_migration_and_compaction, 2025)
+]
+
+def _sorted_rows(df):
+    # Order-independent view of a log's rows
+    return sorted(map(tuple, df.reindex(columns=dm.PROTEIN_COLUMNS).astype(str).values.tolist()))
+
+def _snapshot():
+    return _sorted_rows(dm.load_protein_log())
+
+def _raw_rows():
+    # Every row on disk, read straight from the files before any job runs
+    paths = [dm.PROTEIN_FILE] if os.path.isfile(dm.PROTEIN_FILE) else []
+    for root, _, files in os.walk(dm.PROTEIN_DIR):
+        paths.extend(os.path.join(root, name) for name in files)
+    return _sorted_rows(pd.concat([pd.read_csv(path) for path in paths], ignore_index=True))
+
+def _leftovers(tmp):
+    found = []
+    for root, dirs, files in os.walk(tmp):
+        found.extend(os.path.relpath(os.path.join(root, name), tmp) for name in dirs + files if name.endswith(LEFTOVER_SUFFIXES))
+    return found
+
+def _point_at(tmp):
+    for attr in PATH_ATTRS:
+        setattr(dm, attr, os.path.join(tmp, os.path.basename(getattr(dm, attr))))
+
+def _cold_months(archive_before_year):
+    return [
+        name for name in os.listdir(dm.PROTEIN_DIR)
+        if name.endswith(".csv") and name[4:5] == "-" and int(name[:4]) < archive_before_year
+    ]
+
+def run_scenario(name, fixture, archive_before_year):
+    """
+    Returns (number of fault points, list of failure messages).
+    """
+    if archive_before_year is None:
+        job = dm.load_protein_log
+    else:
+        job = lambda: dm.compact_logs(archive_before_year)
+
+    saved = {attr: getattr(dm, attr) for attr in PATH_ATTRS}
+    failures = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            _point_at(tmp)
+            fixture(tmp)
+            expected = _raw_rows()
+            with FaultInjector() as counter:
+                job()
+            total = counter.calls
+
+        for fail_at in range(1, total + 1):
+            with tempfile.TemporaryDirectory() as tmp:
+                _point_at(tmp)
+                fixture(tmp)
+                try:
+                    with FaultInjector(fail_at):
+                        job()
+                except InjectedFault as exc:
+                    where = f"{name}, fault {fail_at}/{total} ({exc})"
+                else:
+                    failures.append(f"{name}, fault {fail_at}/{total}: job didn't fail")
+                    continue
+
+                if _snapshot() != expected:
+                    failures.append(f"{where}: rows lost or duplicated after the failure")
+                job()
+                if _snapshot() != expected:
+                    failures.append(f"{where}: rows lost or duplicated after re-running")
+                leftovers = _leftovers(tmp)
+                if leftovers:
+                    failures.append(f"{where}: re-run left {', '.join(leftovers)}")
+                if archive_before_year and _cold_months(archive_before_year):
+                    failures.append(f"{where}: re-run didn't archive {', '.join(_cold_months(archive_before_year))}")
+    finally:
+        for attr, value in saved.items():
+            setattr(dm, attr, value)
+    return total, failures
+
+def main():
+    failures = []
+    for name, fixture, archive_before_year in SCENARIOS:
+        total, problems = run_scenario(name, fixture, archive_before_year)
+        print(f"{name}: {total} fault points, {len(problems)} failures")
+        failures.extend(problems)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
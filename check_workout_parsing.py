@@ -0,0 +1,60 @@
+"""
+Table-driven checks for data_manager.parse_sets_reps.
+
+Each case is (Target_Sets_Reps, Reps, expected reps per set), covering the
+free-text forms people actually type into the workout log.
+
+Usage: python check_workout_parsing.py
+Exits with status 1 if any case fails.
+"""
+import sys
+import data_manager as dm
+
+CASES = [
+    # Target scheme only
+    ("3x10", "", [10, 10, 10]),
+    ("4 sets of 8", "", [8, 8, 8, 8]),
+    ("", "", []),
+    (None, float("nan"), []),
+
+    # Reps written as a scheme or a set count
+    ("3x10", "3x10", [10, 10, 10]),
+    ("", "4 sets of 8", [8, 8, 8, 8]),
+    ("3x10", "3 sets", [10, 10, 10]),
+    ("", "3 sets", []),
+
+    # Reps per set
+    ("3x10", "10,8,6", [10, 8, 6]),
+    ("3x8", "8 8 8", [8, 8, 8]),
+    ("3x10", "8-10", [8, 8, 8]),
+    ("3x8", "7", [7, 7, 7]),
+    ("", "8", [8]),
+
+    # A single number that matches the whole target is a total
+    ("3x8", "24", [8, 8, 8]),
+
+    # Numeric CSV columns come back as floats
+    ("3x8", "8.0", [8, 8, 8]),
+    ("3x8", 8.0, [8, 8, 8]),
+
+    # Weights are not reps
+    ("3x8", "60kg x 8", [8, 8, 8]),
+    ("3x8", "8 reps @ 60kg", [8, 8, 8]),
+    ("3x8", "8 @ 60", [8, 8, 8]),
+    ("3x8", "135 lbs 8 8 8", [8, 8, 8]),
+    ("3x8", "3x8 @ 62.5 kg", [8, 8, 8]),
+    ("3x8 @ 60kg", "", [8, 8, 8])
+]
+
+def main():
+    failures = 0
+    for target, reps, expected in CASES:
+        got = dm.parse_sets_reps(target, reps)
+        if got != expected:
+            failures += 1
+            print(f"FAIL: parse_sets_reps({target!r}, {reps!r}) = {got}, expected {expected}")
+    print(f"{len(CASES) - failures}/{len(CASES)} parse_sets_reps cases passed")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,21 @@
 import pandas as pd
 import os
 import re
-from datetime import timedelta
+import json
+import shutil
+from datetime import date, timedelta
+import profiler
 
 AUDIT_FILE = os.path.join(os.path.dirname(__file__), "daily_audit.csv")
 RECIPE_FILE = os.path.join(os.path.dirname(__file__), "recipes.csv")
 PROTEIN_FILE = os.path.join(os.path.dirname(__file__), "protein_log.csv")
 WORKOUT_FILE = os.path.join(os.path.dirname(__file__), "workout_log.csv")
+# Protein and workout logs are stored as monthly partitions in these folders
+# (see PARTITIONED LOG STORAGE); the single-file paths above are only read
+# once to migrate older installs.
+PROTEIN_DIR = os.path.join(os.path.dirname(__file__), "protein_log")
+WORKOUT_DIR = os.path.join(os.path.dirname(__file__), "workout_log")
+WORKOUT_STATS_FILE = os.path.join(os.path.dirname(__file__), "workout_stats.json")
 
 REQUIRED_COLUMNS = [
     "Date",
@@ -23,6 +32,8 @@ REQUIRED_COLUMNS = [
     "Supp_Creatine"
 ]
 
+PROTEIN_COLUMNS = ["Date", "Food_Name", "Quantity", "Unit", "Protein_g"]
+
 WORKOUT_COLUMNS = [
     "Date",
     "Exercise",
@@ -35,11 +46,28 @@ WORKOUT_COLUMNS = [
     "Notes"
 ]
 
+def _read_csv(path):
+    df = pd.read_csv(path)
+    profiler.record_file_read(path)
+    return df
+
+def _write_csv(df, path):
+    df.to_csv(path, index=False)
+    profiler.record_file_write(path)
+
+def _append_csv(df, path):
+    exists = os.path.isfile(path)
+    size = os.path.getsize(path) if exists else 0
+    df.to_csv(path, mode="a", header=not exists, index=False)
+    if profiler.active():
+        profiler.count("bytes_written", os.path.getsize(path) - size)
+
+@profiler.instrument()
 def load_audit_data():
     if not os.path.isfile(AUDIT_FILE):
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
     
-    df = pd.read_csv(AUDIT_FILE)
+    df = _read_csv(AUDIT_FILE)
     
     # Ensure all required columns exist
     missing_cols = [col for col in REQUIRED_COLUMNS if col not in df.columns]
@@ -47,10 +75,11 @@ def load_audit_data():
         for col in missing_cols:
             df[col] = 0 if "Hours" in col or "Walks" in col else False
         # Save back to fix the file structure immediately
-        df.to_csv(AUDIT_FILE, index=False)
+        _write_csv(df, AUDIT_FILE)
         
     return df
 
+@profiler.instrument()
 def save_audit_data(entry):
     df = load_audit_data()
     
@@ -62,70 +91,591 @@ def save_audit_data(entry):
     
     # Concatenate and save
     df = pd.concat([df, new_entry_df], ignore_index=True)
-    df.to_csv(AUDIT_FILE, index=False)
+    _write_csv(df, AUDIT_FILE)
 
+@profiler.instrument()
 def load_recipe_data():
     if not os.path.isfile(RECIPE_FILE):
         return pd.DataFrame(columns=["Name", "Tags", "Ingredients", "Instructions"])
-    return pd.read_csv(RECIPE_FILE)
+    return _read_csv(RECIPE_FILE)
 
+@profiler.instrument()
 def save_recipe_data(recipe_entry):
     df = load_recipe_data()
     new_df = pd.DataFrame([recipe_entry])
     df = pd.concat([df, new_df], ignore_index=True)
-    df.to_csv(RECIPE_FILE, index=False)
+    _write_csv(df, RECIPE_FILE)
+
+# --- PARTITIONED LOG STORAGE ---
+# Append-only logs live in a folder of partitions:
+#   YYYY-MM.csv     one file per month, new entries are appended
+#   YYYY.csv.gz     a whole cold year, written by compact_logs()
+#   YYYY.compacting a year part-way through compact_logs() (see _compact_year)
+# Reads with a date range only open the partitions that overlap it.
+
+_PARTITION_RE = re.compile(r"^(\d{4})(?:-(\d{2}))?\.csv(?:\.gz)?$")
+_STAGING_RE = re.compile(r"^(\d{4})\.compacting$")
+
+def _partitioned_logs():
+    # Looked up at call time so the paths can be pointed elsewhere (benchmarks)
+    return [
+        (PROTEIN_FILE, PROTEIN_DIR, PROTEIN_COLUMNS),
+        (WORKOUT_FILE, WORKOUT_DIR, WORKOUT_COLUMNS)
+    ]
+
+def _list_partitions(log_dir):
+    """
+    (first_day, last_day, path) for every partition file, oldest first.
+    Includes the files of an interrupted compaction, so no rows go missing
+    (or get counted twice) while it waits to be resumed.
+    """
+    if not os.path.isdir(log_dir):
+        return []
+    partitions = []
+    staged = {}
+    for name in os.listdir(log_dir):
+        match = _STAGING_RE.match(name)
+        if match:
+            staged[int(match.group(1))] = _staged_partitions(os.path.join(log_dir, name))
+            continue
+        match = _PARTITION_RE.match(name)
+        if not match:
+            continue
+        year = int(match.group(1))
+        if match.group(2):
+            month = int(match.group(2))
+            first = date(year, month, 1)
+            last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        else:
+            first, last = date(year, 1, 1), date(year, 12, 31)
+        partitions.append((first, last, os.path.join(log_dir, name)))
+
+    for year, (archive, months) in staged.items():
+        first, last = date(year, 1, 1), date(year, 12, 31)
+        if archive:
+            # The rebuilt archive already holds the old one and every staged month
+            partitions = [p for p in partitions if p[2] != os.path.join(log_dir, f"{year}.csv.gz")]
+            partitions.append((first, last, archive))
+        else:
+            partitions.extend((first, last, path) for path in months)
+    return sorted(partitions)
+
+def _staged_partitions(staging):
+    """
+    (rebuilt archive or None, [staged month files]) for a YYYY.compacting folder.
+    """
+    year = os.path.basename(staging).split(".")[0]
+    archive = os.path.join(staging, f"{year}.csv.gz")
+    if os.path.isfile(archive):
+        return archive, []
+    return None, [os.path.join(staging, name) for name in sorted(os.listdir(staging)) if name.endswith(".csv")]
+
+def _write_partitioned(df, log_dir, columns):
+    """
+    Appends rows to their monthly partitions. Dates must be 'YYYY-MM-DD'.
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    df = df.reindex(columns=columns)
+    months = df['Date'].astype(str).str[:7]
+    for month, group in df.groupby(months, sort=True):
+        _append_csv(group, os.path.join(log_dir, f"{month}.csv"))
+
+def _migrate_legacy_log(log_file, log_dir, columns):
+    """
+    One-off move of a single-file log into monthly partitions.
+    The original is kept next to it as <file>.migrated.
+
+    Crash-safe: the legacy file is first renamed to
+    <file>.migrating (the in-progress marker), the partitions are built in
+    <dir>.tmp, and the folders are swapped with <dir>.old. Re-running after
+    a crash at any step resumes without duplicating rows.
+    """
+    migrating = log_file + ".migrating"
+    tmp_dir = log_dir + ".tmp"
+    old_dir = log_dir + ".old"
+
+    if not os.path.isfile(migrating):
+        if os.path.isdir(old_dir):
+            # Crashed after finishing, before cleanup
+            shutil.rmtree(old_dir)
+        if not os.path.isfile(log_file):
+            return
+        os.makedirs(log_dir, exist_ok=True)
+        os.replace(log_file, migrating)
+
+    if os.path.isdir(old_dir) and not os.path.isdir(log_dir):
+        # Crashed mid-swap: put the original partitions back and redo
+        os.replace(old_dir, log_dir)
+
+    if not os.path.isdir(old_dir):
+        # Rebuild from scratch: existing partitions plus the legacy rows
+        if os.path.isdir(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        os.makedirs(tmp_dir)
+        for _, _, path in _list_partitions(log_dir):
+            dest = os.path.join(tmp_dir, os.path.relpath(path, log_dir))
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.copy2(path, dest)
+        df = _read_csv(migrating)
+        if not df.empty:
+            df['Date'] = pd.to_datetime(df['Date']).dt.strftime('%Y-%m-%d')
+            _write_partitioned(df, tmp_dir, columns)
+
+        os.makedirs(log_dir, exist_ok=True)
+        os.replace(log_dir, old_dir)
+        os.replace(tmp_dir, log_dir)
+
+    # The swap is done once <dir>.old exists alongside <dir>
+    os.replace(migrating, log_file + ".migrated")
+    shutil.rmtree(old_dir)
+
+def _read_log(log_file, log_dir, columns, start_date=None, end_date=None):
+    """
+    Reads a partitioned log, optionally limited to [start_date, end_date].
+    """
+    _migrate_legacy_log(log_file, log_dir, columns)
+    start = _parse_date(start_date) if start_date is not None else date.min
+    end = _parse_date(end_date) if end_date is not None else date.max
+
+    frames = []
+    for first, last, path in _list_partitions(log_dir):
+        if last < start or first > end:
+            profiler.count("partitions_pruned")
+            continue
+        df = _read_csv(path)
+        if first < start or last > end:
+            # Partition only partly inside the range
+            dates = df['Date'].astype(str).str[:10]
+            df = df[(dates >= str(start)) & (dates <= str(end))]
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+def _append_log_entry(log_file, log_dir, columns, entry):
+    _migrate_legacy_log(log_file, log_dir, columns)
+    _write_partitioned(pd.DataFrame([entry]), log_dir, columns)
+
+def _log_mtime(log_dir):
+    partitions = _list_partitions(log_dir)
+    if not partitions:
+        return None
+    return max(os.path.getmtime(path) for _, _, path in partitions)
+
+def _compact_year(log_dir, year, columns):
+    """
+    Merges one year's monthly partitions (and any earlier archive of that
+    year) into YYYY.csv.gz. Returns True if anything was archived.
+
+    Resumable after a crash or a failed delete at any step. The month files
+    are moved into YYYY.compacting/, where readers still see them. The new
+    archive is built inside that folder too; once it exists, readers use it
+    in place of the old archive and the staged months. Only then is the
+    folder emptied and the archive moved into place.
+    """
+    archive = os.path.join(log_dir, f"{year}.csv.gz")
+    staging = os.path.join(log_dir, f"{year}.compacting")
+    staged_archive = os.path.join(staging, f"{year}.csv.gz")
+
+    resumed = os.path.isfile(staged_archive)
+    if resumed:
+        # Crashed after building the archive: finish swapping it in
+        _swap_in_archive(staging, staged_archive, archive)
+
+    months = sorted(
+        name for name in os.listdir(log_dir)
+        if name.startswith(f"{year}-") and _PARTITION_RE.match(name)
+    )
+    if not months and not os.path.isdir(staging):
+        return resumed
+
+    os.makedirs(staging, exist_ok=True)
+    for name in months:
+        # A month can be staged twice if rows were backfilled after a crash
+        target, n = os.path.join(staging, name), 1
+        while os.path.exists(target):
+            target, n = os.path.join(staging, f"{name[:-4]}.{n}.csv"), n + 1
+        os.replace(os.path.join(log_dir, name), target)
+
+    _, staged = _staged_partitions(staging)
+    if not staged:
+        # Crashed after the swap, before removing the empty folder
+        os.rmdir(staging)
+        return resumed
+
+    frames = [_read_csv(path) for path in ([archive] if os.path.isfile(archive) else []) + staged]
+    df = pd.concat(frames, ignore_index=True)
+    df = df.reindex(columns=columns).sort_values('Date', kind='stable')
+
+    # Write then rename, so a crash never leaves a half-written archive
+    tmp_path = staged_archive + ".tmp"
+    df.to_csv(tmp_path, index=False, compression="gzip")
+    os.replace(tmp_path, staged_archive)
+    profiler.record_file_write(staged_archive)
+    _swap_in_archive(staging, staged_archive, archive)
+    return True
+
+def _swap_in_archive(staging, staged_archive, archive):
+    for name in os.listdir(staging):
+        path = os.path.join(staging, name)
+        if path != staged_archive:
+            os.remove(path)
+    os.replace(staged_archive, archive)
+    os.rmdir(staging)
+
+@profiler.instrument()
+def compact_logs(archive_before_year=None):
+    """
+    Maintenance job: merges each cold year's monthly partitions (and any
+    earlier archive of that year) into one gzip-compressed YYYY.csv.gz.
+    Years before archive_before_year (default: the current year) are cold;
+    an interrupted compaction of any year is always finished.
+    Returns {log folder name: [years archived]}.
+    """
+    if archive_before_year is None:
+        archive_before_year = date.today().year
+
+    results = {}
+    for log_file, log_dir, columns in _partitioned_logs():
+        _migrate_legacy_log(log_file, log_dir, columns)
+
+        years = set()
+        for name in os.listdir(log_dir) if os.path.isdir(log_dir) else []:
+            staging = _STAGING_RE.match(name)
+            month = _PARTITION_RE.match(name)
+            if staging:
+                years.add(int(staging.group(1)))
+            elif month and month.group(2) and int(month.group(1)) < archive_before_year:
+                years.add(int(month.group(1)))
+
+        results[os.path.basename(log_dir)] = [
+            year for year in sorted(years) if _compact_year(log_dir, year, columns)
+        ]
+
+    if results.get(os.path.basename(WORKOUT_DIR)):
+        rebuild_workout_stats()
+    return results
 
 # --- PROTEIN TRACKING LOGIC ---
-def load_protein_log():
-    if not os.path.isfile(PROTEIN_FILE):
-        return pd.DataFrame(columns=["Date", "Food_Name", "Quantity", "Unit", "Protein_g"])
-    return pd.read_csv(PROTEIN_FILE)
+@profiler.instrument()
+def load_protein_log(start_date=None, end_date=None):
+    """
+    Protein entries, optionally only those between start_date and end_date (inclusive).
+    """
+    return _read_log(PROTEIN_FILE, PROTEIN_DIR, PROTEIN_COLUMNS, start_date, end_date)
 
+@profiler.instrument()
 def save_protein_entry(entry):
     """
     Appends a new protein entry to the log.
     entry: dict with Date, Food_Name, Quantity, Unit, Protein_g
     """
-    df = load_protein_log()
-    new_df = pd.DataFrame([entry])
-    df = pd.concat([df, new_df], ignore_index=True)
-    df.to_csv(PROTEIN_FILE, index=False)
+    entry = {**entry, "Date": str(_parse_date(entry["Date"]))}
+    _append_log_entry(PROTEIN_FILE, PROTEIN_DIR, PROTEIN_COLUMNS, entry)
 
+@profiler.instrument()
 def get_daily_protein_total(date_str):
-    df = load_protein_log()
+    df = load_protein_log(date_str, date_str)
     if df.empty:
         return 0.0
     
     day_entries = df[df['Date'] == date_str]
     return day_entries['Protein_g'].sum()
 
+@profiler.instrument()
 def get_protein_log_for_date(date_str):
-    df = load_protein_log()
+    df = load_protein_log(date_str, date_str)
     if df.empty:
         return pd.DataFrame()
     return df[df['Date'] == date_str]
 
 # --- WORKOUT TRACKING LOGIC ---
-def load_workout_log():
-    if not os.path.isfile(WORKOUT_FILE):
-        return pd.DataFrame(columns=WORKOUT_COLUMNS)
-    return pd.read_csv(WORKOUT_FILE)
+@profiler.instrument()
+def load_workout_log(start_date=None, end_date=None):
+    """
+    Workout entries, optionally only those between start_date and end_date (inclusive).
+    """
+    return _read_log(WORKOUT_FILE, WORKOUT_DIR, WORKOUT_COLUMNS, start_date, end_date)
 
+@profiler.instrument()
 def save_workout_entry(entry):
     """
     Appends a new workout entry to the log.
     entry: dict matching WORKOUT_COLUMNS
     """
-    df = load_workout_log()
-    new_df = pd.DataFrame([entry])
-    df = pd.concat([df, new_df], ignore_index=True)
-    df.to_csv(WORKOUT_FILE, index=False)
+    entry = {**entry, "Date": str(_parse_date(entry["Date"]))}
+
+    # Load the stats index first so a rebuild doesn't already include this entry
+    stats = load_workout_stats()
+    _append_log_entry(WORKOUT_FILE, WORKOUT_DIR, WORKOUT_COLUMNS, entry)
+
+    # Keep the derived stats index in step with the log
+    _update_workout_stats(stats, entry)
+    _save_workout_stats(stats)
+
+# --- WORKOUT STATS INDEX ---
+# Derived per-exercise aggregates (PRs, volume, weekly totals) so progression
+# views never have to rescan and re-parse the whole workout log.
+
+def _clean_str(value):
+    if value is None or pd.isna(value):
+        return ""
+    return str(value).strip()
+
+def _to_float(value):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if value != value else value  # NaN -> 0
+
+_SCHEME_RE = re.compile(r"(\d+)\s*(?:x|\*|sets?\s*(?:of|x)?)\s*(\d+)")
+
+# Weights aren't reps: '60kg', '135 lbs' or anything after an '@', e.g. '8 @ 60'
+_WEIGHT_RE = re.compile(r"@\s*\d+(?:\.\d+)?(?:\s*(?:kgs?|lbs?)\b)?|\d+(?:\.\d+)?\s*(?:kgs?|lbs?)\b")
+
+def _parse_scheme(text):
+    """
+    (sets, reps) from a scheme like '3x10' or '4 sets of 8', else (0, 0).
+    """
+    match = _SCHEME_RE.search(text)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    return 0, 0
+
+def parse_sets_reps(target_sets_reps, reps):
+    """
+    Turns the free-text Target_Sets_Reps / Reps fields into a list of reps per set.
+    Handles things like '3x10', '4 sets of 8', '10,8,6', '8 8 8', '8-10' or '3 sets',
+    ignoring weights such as '60kg x 8' or '8 reps @ 60kg'.
+    Returns an empty list if nothing numeric can be found.
+    """
+    target = _WEIGHT_RE.sub(" ", _clean_str(target_sets_reps).lower())
+    actual = _WEIGHT_RE.sub(" ", _clean_str(reps).lower())
+
+    sets, target_reps = _parse_scheme(target)
+
+    # Reps written as a full scheme, e.g. '3x8'
+    actual_sets, actual_reps = _parse_scheme(actual)
+    if actual_sets:
+        return [actual_reps] * actual_sets
+
+    # Only a set count, e.g. '3 sets': reps come from the target
+    match = re.search(r"(\d+)\s*sets?\b", actual)
+    if match:
+        return [target_reps] * int(match.group(1)) if target_reps else []
+
+    # A range like '8-10' is reps per set, not two sets; count it at the low end
+    actual = re.sub(r"(\d+)\s*[-\u2013]\s*(\d+)", r"\1", actual)
+
+    # Numeric CSV columns come back as floats ('8.0'), so read decimals as one number
+    numbers = [int(float(n)) for n in re.findall(r"\d+(?:\.\d+)?", actual)]
+    if len(numbers) > 1:
+        # Explicit reps for each set
+        return numbers
+    if len(numbers) == 1:
+        if sets and target_reps and numbers[0] == sets * target_reps:
+            # Total reps for the whole target, e.g. '24' for '3x8'
+            return [target_reps] * sets
+        # Otherwise a single number is reps per set when the set count is known
+        return [numbers[0]] * sets if sets else numbers
+    if sets and target_reps:
+        return [target_reps] * sets
+    return []
+
+def workout_entry_metrics(entry):
+    """
+    Numeric view of a single workout log row.
+    Volume is working (max) weight x total reps; e1RM uses the Epley formula
+    on the lowest rep set, which is usually the top set.
+    """
+    rep_sets = parse_sets_reps(entry.get("Target_Sets_Reps"), entry.get("Reps"))
+    weight = _to_float(entry.get("Max_Weight")) or _to_float(entry.get("Min_Weight"))
+    total_reps = sum(rep_sets)
+    e1rm = weight * (1 + min(rep_sets) / 30) if rep_sets and weight else 0.0
+    return {
+        "sets": len(rep_sets),
+        "reps": total_reps,
+        "weight": weight,
+        "volume": weight * total_reps,
+        "e1rm": round(e1rm, 2)
+    }
+
+def _parse_date(value):
+    # Log dates are 'YYYY-MM-DD'; pd.to_datetime per row is ~1ms, so only use it as a fallback
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return pd.to_datetime(value).date()
+
+def _week_key(day):
+    iso = day.isocalendar()
+    return f"{iso[0]}-W{iso[1]:02d}"
+
+# Bump when parsing/metrics change so existing indexes get rebuilt
+WORKOUT_STATS_VERSION = 3
+
+def _empty_workout_stats():
+    return {"version": WORKOUT_STATS_VERSION, "rows": 0, "exercises": {}, "muscles": {}}
+
+def _update_workout_stats(stats, entry):
+    """
+    Folds one workout entry into the stats index in place.
+    """
+    name = _clean_str(entry.get("Exercise"))
+    if not name:
+        stats["rows"] += 1
+        return stats
+
+    day = _parse_date(entry["Date"])
+    date_str = str(day)
+    week = _week_key(day)
+    metrics = workout_entry_metrics(entry)
+
+    ex = stats["exercises"].setdefault(name.lower(), {
+        "Exercise": name,
+        "sessions": 0,
+        "total_volume": 0.0,
+        "pr_weight": 0.0,
+        "pr_weight_date": None,
+        "pr_e1rm": 0.0,
+        "pr_e1rm_date": None,
+        "last_date": None,
+        "last_entry": None,
+        "weekly_volume": {}
+    })
+    ex["sessions"] += 1
+    ex["total_volume"] += metrics["volume"]
+    ex["weekly_volume"][week] = ex["weekly_volume"].get(week, 0.0) + metrics["volume"]
+
+    if metrics["weight"] > ex["pr_weight"]:
+        ex["pr_weight"] = metrics["weight"]
+        ex["pr_weight_date"] = date_str
+    if metrics["e1rm"] > ex["pr_e1rm"]:
+        ex["pr_e1rm"] = metrics["e1rm"]
+        ex["pr_e1rm_date"] = date_str
+
+    if ex["last_date"] is None or date_str >= ex["last_date"]:
+        ex["last_date"] = date_str
+        ex["last_entry"] = {
+            "Target_Sets_Reps": _clean_str(entry.get("Target_Sets_Reps")),
+            "Reps": _clean_str(entry.get("Reps")),
+            "Min_Weight": _to_float(entry.get("Min_Weight")),
+            "Max_Weight": _to_float(entry.get("Max_Weight")),
+            **metrics
+        }
+
+    muscle = _clean_str(entry.get("Target_Muscle"))
+    if muscle:
+        weeks = stats["muscles"].setdefault(muscle.title(), {})
+        weeks[week] = weeks.get(week, 0.0) + metrics["volume"]
+
+    stats["rows"] += 1
+    return stats
+
+def _save_workout_stats(stats):
+    with open(WORKOUT_STATS_FILE, "w") as f:
+        json.dump(stats, f)
+    profiler.record_file_write(WORKOUT_STATS_FILE)
+
+@profiler.instrument()
+def rebuild_workout_stats():
+    """
+    Recomputes the stats index from the full workout log.
+    """
+    stats = _empty_workout_stats()
+    for entry in load_workout_log().to_dict("records"):
+        _update_workout_stats(stats, entry)
+    _save_workout_stats(stats)
+    return stats
+
+@profiler.instrument()
+def load_workout_stats():
+    """
+    Returns the per-exercise stats index, rebuilding it if it is missing,
+    from an older WORKOUT_STATS_VERSION, or older than the workout log
+    (e.g. a partition was edited by hand).
+    """
+    _migrate_legacy_log(WORKOUT_FILE, WORKOUT_DIR, WORKOUT_COLUMNS)
+    log_mtime = _log_mtime(WORKOUT_DIR)
+    stats_fresh = os.path.isfile(WORKOUT_STATS_FILE) and (
+        log_mtime is None or os.path.getmtime(WORKOUT_STATS_FILE) >= log_mtime
+    )
+    if stats_fresh:
+        try:
+            with open(WORKOUT_STATS_FILE) as f:
+                stats = json.load(f)
+            profiler.record_file_read(WORKOUT_STATS_FILE)
+        except (OSError, ValueError):
+            stats = None
+        if stats is not None and stats.get("version") == WORKOUT_STATS_VERSION:
+            profiler.count("workout_stats.cache_hit")
+            return stats
+    profiler.count("workout_stats.cache_miss")
+    if log_mtime is None:
+        return _empty_workout_stats()
+    return rebuild_workout_stats()
+
+@profiler.instrument()
+def get_exercise_stats(exercise):
+    """
+    Stats for one exercise (PRs, last session, weekly volume) or None.
+    """
+    return load_workout_stats()["exercises"].get(str(exercise).strip().lower())
+
+# --- ANALYSIS HELPERS ---
+# Chart-prep for the Analysis tab, kept here so it can be benchmarked outside Streamlit.
+
+HABIT_COLUMNS = ['Gym', 'Cardio', 'Diet_Adherence', 'Dog_Walks', 'Dog_Grooming', 'Supp_Omega3']
+
+@profiler.instrument()
+def study_hours_long(audit_df):
+    """
+    Long-format (Date, Type, Hours) study hours for the stacked bar chart.
+    """
+    return audit_df[['Date', 'CPA_Hours', 'Tech_AI_Hours']].melt('Date', var_name='Type', value_name='Hours')
+
+@profiler.instrument()
+def habit_heatmap_data(audit_df):
+    """
+    (Date, Habit, Done) rows for the habit heatmap. Expects Date as datetimes.
+    """
+    heatmap_data = []
+    for idx, row in audit_df.iterrows():
+        d_str = row['Date'].strftime('%Y-%m-%d')
+        for habit in HABIT_COLUMNS:
+            val = 1 if row[habit] else 0
+            if habit == 'Dog_Walks' and row[habit] > 0: val = 1
+            heatmap_data.append({'Date': d_str, 'Habit': habit, 'Done': val})
+    return pd.DataFrame(heatmap_data, columns=['Date', 'Habit', 'Done'])
+
+@profiler.instrument()
+def daily_protein_totals(protein_df):
+    """
+    Total Protein_g per day.
+    """
+    protein_df['Date'] = pd.to_datetime(protein_df['Date'])
+    return protein_df.groupby('Date')['Protein_g'].sum().reset_index()
+
+@profiler.instrument()
+def muscle_weekly_volume(stats):
+    """
+    (Week, Muscle, Volume) rows from the workout stats index.
+    """
+    return pd.DataFrame([
+        {'Week': week, 'Muscle': muscle, 'Volume': vol}
+        for muscle, weeks in stats['muscles'].items()
+        for week, vol in weeks.items()
+    ], columns=['Week', 'Muscle', 'Volume']).sort_values('Week')
 
 # --- EXISTING HELPERS ---
 
-def calculate_streaks(df):
+@profiler.instrument()
+def calculate_streaks(df, today=None):
     """
-    Calculates streaks for CPA, Gym, Dog Care, and Tech.
+    Calculates streaks for CPA, Gym, Dog Care, and Tech, counting back from
+    today (or the given date).
     Returns a dictionary of streaks.
     """
     if df.empty:
@@ -136,7 +686,7 @@ def calculate_streaks(df):
     
     streaks = {"CPA": 0, "Gym": 0, "Dog": 0, "Tech": 0}
     
-    today = pd.to_datetime("today").normalize()
+    today = pd.to_datetime("today" if today is None else today).normalize()
     
     # Define success criteria
     criteria = {
@@ -228,6 +778,7 @@ def parse_ingredient(line):
         # No number found, treat as 1 unit
         return {"qty": 1.0, "unit": "pcs", "item": line}
 
+@profiler.instrument()
 def aggregate_ingredients(ingredient_lines):
     """
     Takes a list of ingredient strings and returns a unified list.
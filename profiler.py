@@ -0,0 +1,177 @@
+"""
+Lightweight hot-path instrumentation for the app.
+
+Timers, call counts and counters (bytes read/written, cache hits) for
+data_manager, ai_utils and the app's tab render blocks.
+
+Data goes to a Collector that belongs to one script run. The app calls
+start_run() at the top of every rerun; the collector is kept in a context
+variable, so concurrent Streamlit sessions (each rerun runs in its own
+thread) never see or clear each other's data. With no collector active,
+each instrumented call costs one context-variable lookup.
+
+GROWTH_PROFILE=1 only sets the default for the Settings tab's toggle.
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+
+ENABLED = os.environ.get("GROWTH_PROFILE") == "1"
+
+# Keeps a runaway loop from growing the event list without bound
+MAX_EVENTS = 10_000
+
+class Collector:
+    """
+    Timings and counters for a single script run.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []    # dicts: name, cat, start (s since origin), dur (s), tid
+        self.stats = {}     # name -> {"calls", "total_ms", "max_ms"}
+        self.counters = {}  # name -> number
+
+    def record(self, name, category, start, duration):
+        if len(self.events) < MAX_EVENTS:
+            self.events.append({
+                "name": name,
+                "cat": category,
+                "start": start - self.origin,
+                "dur": duration,
+                "tid": threading.get_ident()
+            })
+        stat = self.stats.setdefault(name, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stat["calls"] += 1
+        stat["total_ms"] += duration * 1000
+        stat["max_ms"] = max(stat["max_ms"], duration * 1000)
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+_current = contextvars.ContextVar("profiler_collector", default=None)
+
+def start_run(enabled=True):
+    """
+    Starts collecting for the current script run (or stops, if not enabled).
+    Returns the new Collector, or None.
+    """
+    collector = Collector() if enabled else None
+    _current.set(collector)
+    return collector
+
+def current():
+    return _current.get()
+
+def active():
+    return _current.get() is not None
+
+def instrument(name=None, category="call"):
+    """
+    Decorator that times every call to the wrapped function.
+    Defaults to '<module>.<function>' as the timer name.
+    """
+    def decorator(fn):
+        label = name or f"{fn.__module__}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            collector = _current.get()
+            if collector is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                collector.record(label, category, start, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+class section:
+    """
+    Context manager that times a block, e.g. a tab's render code.
+    """
+    __slots__ = ("name", "category", "collector", "start")
+
+    def __init__(self, name, category="render"):
+        self.name = name
+        self.category = category
+        self.collector = None
+        self.start = None
+
+    def __enter__(self):
+        self.collector = _current.get()
+        if self.collector is not None:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.collector is not None:
+            self.collector.record(self.name, self.category, self.start, time.perf_counter() - self.start)
+        return False
+
+def count(name, amount=1):
+    collector = _current.get()
+    if collector is not None:
+        collector.count(name, amount)
+
+def record_file_read(path):
+    if active() and os.path.isfile(path):
+        count("bytes_read", os.path.getsize(path))
+
+def record_file_write(path):
+    if active() and os.path.isfile(path):
+        count("bytes_written", os.path.getsize(path))
+
+# --- REPORTING ---
+# All of these describe the current run's collector (empty if none).
+
+def summary():
+    """
+    Per-timer totals, slowest first.
+    """
+    collector = _current.get()
+    if collector is None:
+        return []
+    rows = [{"name": name, **stat} for name, stat in collector.stats.items()]
+    for row in rows:
+        row["total_ms"] = round(row["total_ms"], 3)
+        row["max_ms"] = round(row["max_ms"], 3)
+    return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+def counters():
+    collector = _current.get()
+    return dict(collector.counters) if collector is not None else {}
+
+def _events():
+    collector = _current.get()
+    return list(collector.events) if collector is not None else []
+
+def to_json():
+    return json.dumps({"timers": summary(), "counters": counters(), "events": _events()}, indent=2)
+
+def to_chrome_trace():
+    """
+    Trace Event Format JSON, viewable in chrome://tracing or Perfetto.
+    """
+    trace = [{
+        "name": e["name"],
+        "cat": e["cat"],
+        "ph": "X",
+        "ts": round(e["start"] * 1e6, 3),
+        "dur": round(e["dur"] * 1e6, 3),
+        "pid": os.getpid(),
+        "tid": e["tid"]
+    } for e in _events()]
+    end_ts = max((t["ts"] + t["dur"] for t in trace), default=0)
+    trace.extend({
+        "name": name,
+        "ph": "C",
+        "ts": end_ts,
+        "pid": os.getpid(),
+        "args": {name: value}
+    } for name, value in counters().items())
+    return json.dumps({"traceEvents": trace, "displayTimeUnit": "ms"})
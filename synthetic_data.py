@@ -0,0 +1,188 @@
+"""
+Deterministic synthetic data for benchmarking data_manager.
+
+Generates realistic-looking audit, protein, workout and recipe data going
+back from an end date (END_DATE unless given). The same seed, size and end
+date always produce the same rows. Protein and workout logs scale by row count (1k up to 10M); the audit
+log has one row per day, so it is capped at MAX_HISTORY_DAYS.
+
+Usage: python synthetic_data.py OUTPUT_DIR --rows 100000 [--seed 42]
+"""
+import argparse
+import math
+import os
+import numpy as np
+import pandas as pd
+import data_manager as dm
+
+END_DATE = "2026-06-30"
+
+# pandas timestamps only go back to 1677, so history is capped at this many days.
+# Past that, logs get more entries per day instead of more days.
+MAX_HISTORY_DAYS = 100_000
+
+PROTEIN_ENTRIES_PER_DAY = 5
+WORKOUT_ENTRIES_PER_DAY = 5
+
+FOODS = [
+    # (Food_Name, Unit, typical Quantity, Protein_g per unit)
+    ("Chicken Breast", "g", 200, 0.31),
+    ("Eggs", "pcs", 3, 6.0),
+    ("Greek Yogurt", "g", 170, 0.10),
+    ("Whey Protein", "scoop", 1, 24.0),
+    ("Paneer", "g", 100, 0.18),
+    ("Lentils", "cup", 1, 18.0),
+    ("Tofu", "g", 150, 0.08),
+    ("Salmon", "g", 150, 0.25),
+    ("Milk", "ml", 250, 0.034),
+    ("Peanut Butter", "tbsp", 2, 4.0)
+]
+
+EXERCISES = [
+    # (Exercise, Target_Muscle, Region, base weight kg)
+    ("Bench Press", "Chest", "Upper Body", 60),
+    ("Incline Dumbbell Press", "Chest", "Upper Body", 22),
+    ("Squat", "Quads", "Lower Body", 80),
+    ("Deadlift", "Back", "Full Body", 100),
+    ("Barbell Row", "Back", "Upper Body", 55),
+    ("Overhead Press", "Shoulders", "Upper Body", 40),
+    ("Lateral Raise", "Shoulders", "Upper Body", 8),
+    ("Bicep Curl", "Biceps", "Upper Body", 12),
+    ("Tricep Pushdown", "Triceps", "Upper Body", 25),
+    ("Leg Press", "Quads", "Lower Body", 140),
+    ("Romanian Deadlift", "Hamstrings", "Lower Body", 70),
+    ("Plank", "Abs", "Core", 0)
+]
+
+SET_SCHEMES = ["3x8", "3x10", "4x6", "4 sets of 8", "5x5", "3x12"]
+
+INGREDIENTS = [
+    "200g chicken", "2 eggs", "1 cup rice", "100g paneer", "1/2 cup oats",
+    "1 tbsp olive oil", "150g tofu", "250ml milk", "1 onion", "2 tomatoes",
+    "50g spinach", "1 scoop whey", "100g lentils", "1 kg potatoes", "30g almonds"
+]
+
+def _dates(days, end=END_DATE):
+    return pd.date_range(end=end, periods=days, freq="D")
+
+def _per_day_dates(rows, per_day, rng, end):
+    """
+    Spreads `rows` entries over consecutive days, roughly `per_day` each,
+    returned in chronological order as 'YYYY-MM-DD' strings.
+    """
+    days = min(max(1, math.ceil(rows / per_day)), MAX_HISTORY_DAYS)
+    day_index = np.sort(rng.integers(0, days, size=rows))
+    return _dates(days, end).strftime("%Y-%m-%d").to_numpy()[day_index]
+
+def generate_audit(days, seed=42, end=END_DATE):
+    days = min(days, MAX_HISTORY_DAYS)
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Date": _dates(days, end).strftime("%Y-%m-%d"),
+        "CPA_Hours": np.round(rng.choice([0, 0.5, 1, 1.5, 2, 3, 4], size=days), 2),
+        "Tech_AI_Hours": np.round(rng.choice([0, 0.5, 1, 1.5, 2], size=days), 2),
+        "Gym": rng.random(days) < 0.7,
+        "Cardio": rng.random(days) < 0.5,
+        "Dog_Walks": rng.integers(0, 4, size=days),
+        "Dog_Grooming": rng.random(days) < 0.1,
+        "Diet_Adherence": rng.random(days) < 0.75,
+        "Supp_Omega3": rng.random(days) < 0.85,
+        "Supp_Magnesium": rng.random(days) < 0.8,
+        "Supp_VitD": rng.random(days) < 0.8,
+        "Supp_Creatine": rng.random(days) < 0.9
+    }, columns=dm.REQUIRED_COLUMNS)
+
+def generate_protein(rows, seed=42, end=END_DATE):
+    rng = np.random.default_rng(seed)
+    food_idx = rng.integers(0, len(FOODS), size=rows)
+    names, units, base_qty, per_unit = (np.array(col, dtype=object) for col in zip(*FOODS))
+    qty = np.round(base_qty[food_idx].astype(float) * rng.uniform(0.5, 1.5, size=rows), 1)
+    return pd.DataFrame({
+        "Date": _per_day_dates(rows, PROTEIN_ENTRIES_PER_DAY, rng, end),
+        "Food_Name": names[food_idx],
+        "Quantity": qty,
+        "Unit": units[food_idx],
+        "Protein_g": np.round(qty * per_unit[food_idx].astype(float), 1)
+    })
+
+def generate_workout(rows, seed=42, end=END_DATE):
+    rng = np.random.default_rng(seed)
+    ex_idx = rng.integers(0, len(EXERCISES), size=rows)
+    names, muscles, regions, base_w = (np.array(col, dtype=object) for col in zip(*EXERCISES))
+
+    # Slow linear progression over the whole history plus day-to-day noise
+    progress = np.linspace(0.8, 1.3, rows)
+    max_w = np.round(base_w[ex_idx].astype(float) * progress * rng.uniform(0.9, 1.1, size=rows) / 2.5) * 2.5
+    min_w = np.round(max_w * 0.7 / 2.5) * 2.5
+
+    scheme_idx = rng.integers(0, len(SET_SCHEMES), size=rows)
+    schemes = np.array(SET_SCHEMES, dtype=object)[scheme_idx]
+    # Actual reps per set land at or a little under the target
+    target_reps = np.array([int(s.split()[-1].split("x")[-1]) for s in SET_SCHEMES])
+    reps = target_reps[scheme_idx] - rng.integers(0, 3, size=rows)
+
+    notes = np.where(rng.random(rows) < 0.1, "Felt strong", "")
+    return pd.DataFrame({
+        "Date": _per_day_dates(rows, WORKOUT_ENTRIES_PER_DAY, rng, end),
+        "Exercise": names[ex_idx],
+        "Target_Muscle": muscles[ex_idx],
+        "Region": regions[ex_idx],
+        "Target_Sets_Reps": schemes,
+        "Min_Weight": min_w,
+        "Max_Weight": max_w,
+        "Reps": reps.astype(str),
+        "Notes": notes
+    }, columns=dm.WORKOUT_COLUMNS)
+
+def generate_recipes(count, seed=42):
+    rng = np.random.default_rng(seed)
+    tags = ["High Protein", "Low Carb", "Quick", "Meal Prep"]
+    rows = []
+    for i in range(count):
+        picks = rng.choice(len(INGREDIENTS), size=rng.integers(3, 8), replace=False)
+        rows.append({
+            "Name": f"Recipe {i + 1}",
+            "Tags": ", ".join(rng.choice(tags, size=rng.integers(1, 3), replace=False)),
+            "Ingredients": "\n".join(INGREDIENTS[j] for j in picks),
+            "Instructions": "Prep, cook, serve."
+        })
+    return pd.DataFrame(rows, columns=["Name", "Tags", "Ingredients", "Instructions"])
+
+def generate_dataset(rows, seed=42, end=END_DATE):
+    """
+    All four tables for one scale. `rows` sizes the protein and workout logs;
+    the audit log gets one row per day (capped) and recipes rows // 100 (10-5000).
+    """
+    return {
+        "audit": generate_audit(rows, seed, end),
+        "protein": generate_protein(rows, seed + 1, end),
+        "workout": generate_workout(rows, seed + 2, end),
+        "recipes": generate_recipes(min(max(rows // 100, 10), 5000), seed + 3)
+    }
+
+def write_dataset(directory, rows, seed=42, end=END_DATE):
+    """
+    Writes a generated dataset as the CSV files data_manager reads.
+    Returns a dict of table name -> file path.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = {
+        "audit": os.path.join(directory, os.path.basename(dm.AUDIT_FILE)),
+        "protein": os.path.join(directory, os.path.basename(dm.PROTEIN_FILE)),
+        "workout": os.path.join(directory, os.path.basename(dm.WORKOUT_FILE)),
+        "recipes": os.path.join(directory, os.path.basename(dm.RECIPE_FILE))
+    }
+    for name, df in generate_dataset(rows, seed, end).items():
+        df.to_csv(paths[name], index=False)
+    return paths
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic Growth Engine data.")
+    parser.add_argument("output_dir")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--end", default=END_DATE, help="last date in the data (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    for name, path in write_dataset(args.output_dir, args.rows, args.seed, args.end).items():
+        print(f"{name}: {path}")